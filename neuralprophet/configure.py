@@ -1,17 +1,63 @@
-from collections import OrderedDict
 from dataclasses import dataclass, field
 import numpy as np
 import pandas as pd
 import logging
 import inspect
+import functools
 import torch
-import math
 
 log = logging.getLogger("NP.config")
 
 
+@functools.lru_cache(maxsize=None)
+def _params(cls):
+    return frozenset(inspect.signature(cls).parameters)
+
+
 def from_kwargs(cls, kwargs):
-    return cls(**{k: v for k, v in kwargs.items() if k in inspect.signature(cls).parameters})
+    return cls(**{k: v for k, v in kwargs.items() if k in _params(cls)})
+
+
+def _normalize_growth(growth):
+    """Returns the trend growth, falling back to 'linear' for unknown values."""
+    if growth not in ["off", "linear", "discontinuous"]:
+        log.error("Invalid trend growth '{}'. Set to 'linear'".format(growth))
+        return "linear"
+    return growth
+
+
+def _resolve_threshold(trend_reg_threshold, trend_reg, n_changepoints):
+    """Returns the trend reg threshold as a positive float, or None if disabled."""
+    if isinstance(trend_reg_threshold, bool):
+        if not trend_reg_threshold:
+            return None
+        trend_reg_threshold = 3.0 / (3.0 + (1.0 + trend_reg) * np.sqrt(n_changepoints))
+        log.debug("Trend reg threshold automatically set to: {}".format(trend_reg_threshold))
+        return trend_reg_threshold
+    if trend_reg_threshold < 0:
+        log.warning("Negative trend reg threshold set to zero.")
+        return None
+    if trend_reg_threshold == 0:
+        return None
+    return trend_reg_threshold
+
+
+def _resolve_reg(trend_reg, n_changepoints, trend_reg_threshold):
+    """Returns the scaled trend reg lambda, or 0 if regularization does not apply."""
+    if trend_reg < 0:
+        log.warning("Negative trend reg lambda set to zero.")
+        trend_reg = 0
+    if trend_reg > 0:
+        if n_changepoints > 0:
+            log.info("Note: Trend changepoint regularization is experimental.")
+            return 0.001 * trend_reg
+        log.info("Trend reg lambda ignored due to no changepoints.")
+        if trend_reg_threshold is not None and trend_reg_threshold > 0:
+            log.info("Trend reg threshold ignored due to no changepoints.")
+        return 0
+    if trend_reg_threshold is not None and trend_reg_threshold > 0:
+        log.info("Trend reg threshold ignored due to reg lambda <= 0.")
+    return trend_reg
 
 
 @dataclass
@@ -24,49 +70,21 @@ class Trend:
     trend_reg_threshold: (bool, float)
 
     def __post_init__(self):
-        if self.growth not in ["off", "linear", "discontinuous"]:
-            log.error("Invalid trend growth '{}'. Set to 'linear'".format(self.growth))
-            self.growth = "linear"
-
+        self.growth = _normalize_growth(self.growth)
         if self.growth == "off":
             self.changepoints = None
             self.n_changepoints = 0
-
-        if self.changepoints is not None:
-            self.n_changepoints = len(self.changepoints)
-            self.changepoints = pd.to_datetime(self.changepoints).values
-
-        if type(self.trend_reg_threshold) == bool:
-            if self.trend_reg_threshold:
-                self.trend_reg_threshold = 3.0 / (3.0 + (1.0 + self.trend_reg) * np.sqrt(self.n_changepoints))
-                log.debug("Trend reg threshold automatically set to: {}".format(self.trend_reg_threshold))
-            else:
-                self.trend_reg_threshold = None
-        elif self.trend_reg_threshold < 0:
-            log.warning("Negative trend reg threshold set to zero.")
-            self.trend_reg_threshold = None
-        elif math.isclose(self.trend_reg_threshold, 0):
-            self.trend_reg_threshold = None
-
-        if self.trend_reg < 0:
-            log.warning("Negative trend reg lambda set to zero.")
-            self.trend_reg = 0
-        if self.trend_reg > 0:
-            if self.n_changepoints > 0:
-                log.info("Note: Trend changepoint regularization is experimental.")
-                self.trend_reg = 0.001 * self.trend_reg
-            else:
-                log.info("Trend reg lambda ignored due to no changepoints.")
-                self.trend_reg = 0
-                if self.trend_reg_threshold > 0:
-                    log.info("Trend reg threshold ignored due to no changepoints.")
-        else:
-            if self.trend_reg_threshold is not None and self.trend_reg_threshold > 0:
-                log.info("Trend reg threshold ignored due to reg lambda <= 0.")
+        elif self.changepoints is not None:
+            # stored as int64 nanoseconds
+            self.changepoints = pd.to_datetime(self.changepoints).values.astype("datetime64[ns]", copy=False).view("i8")
+            self.n_changepoints = self.changepoints.shape[0]
+        self.trend_reg_threshold = _resolve_threshold(self.trend_reg_threshold, self.trend_reg, self.n_changepoints)
+        self.trend_reg = _resolve_reg(self.trend_reg, self.n_changepoints, self.trend_reg_threshold)
 
 
 @dataclass
 class Season:
+    __slots__ = ("resolution", "period", "arg")
     resolution: int
     period: float
     arg: str
@@ -80,24 +98,42 @@ class AllSeason:
     yearly_arg: (str, bool, int) = "auto"
     weekly_arg: (str, bool, int) = "auto"
     daily_arg: (str, bool, int) = "auto"
-    periods: OrderedDict = field(init=False)  # contains SeasonConfig objects
+    periods: dict = field(init=False)  # contains SeasonConfig objects
 
     def __post_init__(self):
         if self.reg_lambda > 0 and self.computation == "fourier":
             log.info("Note: Fourier-based seasonality regularization is experimental.")
             self.reg_lambda = 0.01 * self.reg_lambda
-        self.periods = OrderedDict(
-            {
-                "yearly": Season(resolution=6, period=365.25, arg=self.yearly_arg),
-                "weekly": Season(resolution=3, period=7, arg=self.weekly_arg),
-                "daily": Season(resolution=6, period=1, arg=self.daily_arg),
-            }
-        )
+        self.periods = {
+            "yearly": Season(resolution=6, period=365.25, arg=self.yearly_arg),
+            "weekly": Season(resolution=3, period=7, arg=self.weekly_arg),
+            "daily": Season(resolution=6, period=1, arg=self.daily_arg),
+        }
 
     def append(self, name, period, resolution, arg):
         self.periods[name] = Season(resolution=resolution, period=period, arg=arg)
 
 
+def _mul_pow2(value, exponent):
+    """Computes int(value * 2 ** exponent), using bit shifts for integer arguments."""
+    if isinstance(value, int) and float(exponent).is_integer():
+        exponent = int(exponent)
+        return value << exponent if exponent >= 0 else value >> -exponent
+    return int(value * 2 ** exponent)
+
+
+# loss modules hold no parameters or state, so one instance is shared by all configs
+_LOSS_INSTANCES = {
+    name: loss_fn
+    for names, loss_fn in [
+        (("huber", "smoothl1", "smoothl1loss"), torch.nn.SmoothL1Loss()),
+        (("mae", "l1", "l1loss"), torch.nn.L1Loss()),
+        (("mse", "mseloss", "l2", "l2loss"), torch.nn.MSELoss()),
+    ]
+    for name in names
+}
+
+
 @dataclass
 class Train:
     learning_rate: (float, None)
@@ -114,15 +150,11 @@ class Train:
     def __post_init__(self):
         if self.epochs is not None:
             self.lambda_delay = int(self.reg_delay_pct * self.epochs)
-        if type(self.loss_func) == str:
-            if self.loss_func.lower() in ["huber", "smoothl1", "smoothl1loss"]:
-                self.loss_func = torch.nn.SmoothL1Loss()
-            elif self.loss_func.lower() in ["mae", "l1", "l1loss"]:
-                self.loss_func = torch.nn.L1Loss()
-            elif self.loss_func.lower() in ["mse", "mseloss", "l2", "l2loss"]:
-                self.loss_func = torch.nn.MSELoss()
-            else:
+        if isinstance(self.loss_func, str):
+            loss_fn = _LOSS_INSTANCES.get(self.loss_func.lower())
+            if loss_fn is None:
                 raise NotImplementedError("Loss function {} name not defined".format(self.loss_func))
+            self.loss_func = loss_fn
         elif hasattr(torch.nn.modules.loss, self.loss_func.__class__.__name__):
             pass
         else:
@@ -137,31 +169,31 @@ class Train:
         max_epoch: int = 1000,
     ):
         assert n_data >= 1
-        log_data = int(np.log10(n_data))
+        log_data = len(str(int(n_data))) - 1  # floor(log10(n_data))
         if self.batch_size is None:
             log2_batch = 2 * log_data - 1
-            self.batch_size = 2 ** log2_batch
+            self.batch_size = 1 << max(0, log2_batch)
             self.batch_size = min(max_batch, max(min_batch, self.batch_size))
             log.info("Auto-set batch_size to {}".format(self.batch_size))
         if self.epochs is None:
             datamult = 1000.0 / float(n_data)
-            self.epochs = int(datamult * (2 ** (3 + log_data)))
+            self.epochs = int(datamult * (1 << (3 + log_data)))
             self.epochs = min(max_epoch, max(min_epoch, self.epochs))
             log.info("Auto-set epochs to {}".format(self.epochs))
             # also set lambda_delay:
             self.lambda_delay = int(self.reg_delay_pct * self.epochs)
 
     def apply_train_speed(self, batch=False, epoch=False, lr=False):
-        if self.train_speed is not None and not math.isclose(self.train_speed, 0):
+        if self.train_speed is not None and self.train_speed != 0:
             if batch:
-                self.batch_size = max(1, int(self.batch_size * 2 ** self.train_speed))
+                self.batch_size = max(1, _mul_pow2(self.batch_size, self.train_speed))
                 log.info(
                     "train_speed-{} {}creased batch_size to {}".format(
                         self.train_speed, ["in", "de"][int(self.train_speed < 0)], self.batch_size
                     )
                 )
             if epoch:
-                self.epochs = max(1, int(self.epochs * 2 ** -self.train_speed))
+                self.epochs = max(1, _mul_pow2(self.epochs, -self.train_speed))
                 log.info(
                     "train_speed-{} {}creased epochs to {}".format(
                         self.train_speed, ["in", "de"][int(self.train_speed > 0)], self.epochs
@@ -176,18 +208,20 @@ class Train:
                 )
 
     def apply_train_speed_all(self):
-        if self.train_speed is not None and not math.isclose(self.train_speed, 0):
+        if self.train_speed is not None and self.train_speed != 0:
             self.apply_train_speed(batch=True, epoch=True, lr=True)
 
 
 @dataclass
 class Model:
+    __slots__ = ("num_hidden_layers", "d_hidden")
     num_hidden_layers: int
     d_hidden: int
 
 
 @dataclass
 class Covar:
+    __slots__ = ("reg_lambda", "as_scalar", "normalize")
     reg_lambda: float
     as_scalar: bool
     normalize: (bool, str)
@@ -428,12 +428,12 @@ class NeuralProphet:
         df = df_utils.normalize(df, self.data_params)
         if not self.fitted:
             if self.config_trend.changepoints is not None:
-                self.config_trend.changepoints = df_utils.normalize(
-                    pd.DataFrame({"ds": pd.Series(self.config_trend.changepoints)}), self.data_params
-                )["t"].values
-            self.season_config = utils.set_auto_seasonalities(
-                dates=df["ds"].copy(deep=True), season_config=self.season_config
-            )
+                # normalize the int64 nanosecond changepoints like the ds column
+                ds_params = self.data_params["ds"]
+                self.config_trend.changepoints = (
+                    self.config_trend.changepoints - ds_params.shift.value
+                ) / ds_params.scale.value
+            self.season_config = utils.set_auto_seasonalities(dates=df["ds"], season_config=self.season_config)
             if self.country_holidays_config is not None:
                 self.country_holidays_config["holiday_names"] = utils.get_holidays_from_country(
                     self.country_holidays_config["country"], df["ds"]
@@ -13,6 +13,13 @@ import logging
 
 log = logging.getLogger("NP.utils")
 
+# auto-seasonality thresholds, as int64 nanoseconds
+_TD_730D = pd.Timedelta(days=730).value
+_TD_2W = pd.Timedelta(weeks=2).value
+_TD_1W = pd.Timedelta(weeks=1).value
+_TD_2D = pd.Timedelta(days=2).value
+_TD_1D = pd.Timedelta(days=1).value
+
 
 def get_regularization_lambda(sparsity, lambda_delay_epochs=None, epoch=None):
     """Computes regularization lambda strength for a given sparsity and epoch.
@@ -340,20 +347,23 @@ def set_auto_seasonalities(dates, season_config):
 
     """
     log.debug("seasonality config received: {}".format(season_config))
-    first = dates.min()
-    last = dates.max()
-    dt = dates.diff()
-    min_dt = dt.iloc[dt.values.nonzero()[0]].min()
+    # work on the int64 nanosecond view of the datestamps
+    dates_ns = dates.values.astype("datetime64[ns]", copy=False).view("i8")
+    first = dates_ns.min()
+    last = dates_ns.max()
+    dt = np.diff(dates_ns)
+    dt = dt[dt != 0]
+    min_dt = dt.min() if dt.size else np.iinfo(np.int64).max
     auto_disable = {
-        "yearly": last - first < pd.Timedelta(days=730),
-        "weekly": ((last - first < pd.Timedelta(weeks=2)) or (min_dt >= pd.Timedelta(weeks=1))),
-        "daily": ((last - first < pd.Timedelta(days=2)) or (min_dt >= pd.Timedelta(days=1))),
+        "yearly": last - first < _TD_730D,
+        "weekly": ((last - first < _TD_2W) or (min_dt >= _TD_1W)),
+        "daily": ((last - first < _TD_2D) or (min_dt >= _TD_1D)),
     }
-    for name, period in season_config.periods.items():
+    for name, period in list(season_config.periods.items()):
         arg = period.arg
         default_resolution = period.resolution
         if arg == "custom":
-            continue
+            resolution = default_resolution
         elif arg == "auto":
             resolution = 0
             if auto_disable[name]:
@@ -369,13 +379,10 @@ def set_auto_seasonalities(dates, season_config):
             resolution = 0
         else:
             resolution = int(arg)
-        season_config.periods[name].resolution = resolution
-
-    new_periods = OrderedDict({})
-    for name, period in season_config.periods.items():
-        if period.resolution > 0:
-            new_periods[name] = period
-    season_config.periods = new_periods
+        if resolution > 0:
+            period.resolution = resolution
+        else:
+            del season_config.periods[name]
     season_config = season_config if len(season_config.periods) > 0 else None
     log.debug("seasonality config: {}".format(season_config))
     return season_config
@@ -13,6 +13,7 @@ from neuralprophet import (
     df_utils,
     time_dataset,
     configure,
+    utils,
 )
 
 log = logging.getLogger("NP.test")
@@ -115,6 +116,20 @@ class UnitTests(unittest.TestCase):
             )
             df_norm = df_utils.normalize(df, data_params)
 
+    def test_normalize_changepoints(self):
+        df = pd.read_csv(PEYTON_FILE, nrows=512)
+        df = df_utils.check_dataframe(df)
+        changepoints = ["2007-12-10", "2008-03-01 12:30:00", "2008-09-15", "2009-01-01 06:00:00"]
+        m = NeuralProphet(changepoints=changepoints)
+        data_params = df_utils.init_data_params(df.copy(deep=True), normalize=m.normalize)
+        expected = df_utils.normalize(pd.DataFrame({"ds": pd.to_datetime(changepoints)}), data_params)["t"].values
+        # normalizes the int64 nanosecond changepoints during train loader setup
+        m._init_train_loader(df.copy(deep=True))
+        # TimeNet prepends the series start (t=0) as the first changepoint
+        changepoints_t = m.config_trend.changepoints[1:]
+        log.debug("changepoints: {}, expected: {}".format(changepoints_t, expected))
+        assert np.array_equal(changepoints_t, expected)
+
     def test_auto_batch_epoch(self):
         check = {
             "1": (1, 1000),
@@ -134,6 +149,30 @@ class UnitTests(unittest.TestCase):
             assert c.batch_size == batch
             assert c.epochs == epoch
 
+    def test_auto_seasonalities(self):
+        check = {
+            PEYTON_FILE: ["yearly", "weekly"],
+            AIR_FILE: ["yearly"],
+            YOS_FILE: ["weekly", "daily"],
+        }
+        for data_file, expected in check.items():
+            df = df_utils.check_dataframe(pd.read_csv(data_file))
+            season_config = utils.set_auto_seasonalities(df["ds"], configure.AllSeason())
+            log.debug("{}: {}".format(data_file, list(season_config.periods)))
+            assert list(season_config.periods) == expected
+
+    def test_trend_reg_without_changepoints(self):
+        for trend_reg_threshold in [False, True, 0, 0.1]:
+            c = configure.Trend(
+                growth="linear",
+                changepoints=None,
+                n_changepoints=0,
+                changepoints_range=0.8,
+                trend_reg=1,
+                trend_reg_threshold=trend_reg_threshold,
+            )
+            assert c.trend_reg == 0
+
     def test_train_speed(self):
         df = pd.read_csv(PEYTON_FILE, nrows=102)[:100]
         batch_size = 16